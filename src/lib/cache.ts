@@ -0,0 +1,39 @@
+/**
+ * Small TTL + LRU cache for read-mostly TripIt responses.
+ */
+
+export class TtlCache<V> {
+  private entries = new Map<string, { expires: number; value: V }>();
+
+  constructor(
+    private defaultTtlMs: number,
+    private maxEntries = 128
+  ) {}
+
+  get(key: string, now = Date.now()): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+    if (entry.expires <= now) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    // Map iterates in insertion order, so re-inserting a hit keeps the least
+    // recently used entry at the front for eviction.
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: string, value: V, ttlMs = this.defaultTtlMs, now = Date.now()): void {
+    if (this.entries.size >= this.maxEntries && !this.entries.has(key)) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest !== undefined) this.entries.delete(oldest);
+    }
+    this.entries.delete(key);
+    this.entries.set(key, { expires: now + ttlMs, value });
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
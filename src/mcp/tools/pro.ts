@@ -58,12 +58,14 @@ export async function handleProTool(
           };
         }
 
-        let segments = airObject.Segment;
-        if (!Array.isArray(segments)) {
-          segments = [segments];
-        }
+        // TripIt returns a bare object for a single-segment flight and an
+        // array for multi-segment itineraries; Segment is always present on
+        // a fetched AirObject.
+        const segments: FlightSegment[] = Array.isArray(airObject.Segment)
+          ? airObject.Segment
+          : [airObject.Segment];
 
-        const statusInfo = (segments as FlightSegment[]).map((seg) => ({
+        const statusInfo = segments.map((seg) => ({
           flight: `${seg.marketing_airline_code}${seg.marketing_flight_number}`,
           route: `${seg.start_airport_code} → ${seg.end_airport_code}`,
           status: seg.Status?.flight_status || 'Not monitored',
@@ -7,6 +7,7 @@
 
 import { TripItOAuth } from './oauth.js';
 import { TripItError, AuthenticationError, NotFoundError } from '../lib/errors.js';
+import { TtlCache } from '../lib/cache.js';
 import type {
   ObjectType,
   CreatableObjectType,
@@ -21,84 +22,284 @@ import type {
 const BASE_URL = 'https://api.tripit.com/v1';
 const MAX_RETRIES = 3;
 const BASE_DELAY_MS = 1000;
-const MIN_REQUEST_INTERVAL_MS = 400; // ~2.5 req/sec
+
+// Exponential backoff schedule (1s, 2s, 4s), computed once instead of
+// per retry; indexed by attempt number.
+const BACKOFF_MS: readonly number[] = Array.from(
+  { length: MAX_RETRIES },
+  (_, i) => BASE_DELAY_MS * 2 ** i
+);
+
+// Static headers shared by every request. The Workers runtime keeps per-origin
+// connections alive across fetches, so all traffic to api.tripit.com reuses the
+// same pooled TLS connection; asking for gzip keeps the heavy include_objects
+// payloads small on the wire.
+const STATIC_HEADERS: Readonly<Record<string, string>> = Object.freeze({
+  'Content-Type': 'application/x-www-form-urlencoded',
+  'Accept-Encoding': 'gzip',
+});
+
+// Object type -> TripIt's expected payload key, built once at module load
+// rather than on every create/update call.
+const TYPE_TO_KEY: Readonly<Record<string, string>> = Object.freeze({
+  air: 'AirObject',
+  lodging: 'LodgingObject',
+  car: 'CarObject',
+  rail: 'RailObject',
+  cruise: 'CruiseObject',
+  restaurant: 'RestaurantObject',
+  activity: 'ActivityObject',
+  note: 'NoteObject',
+  directions: 'DirectionsObject',
+  transport: 'TransportObject',
+  parking: 'ParkingObject',
+  map: 'MapObject',
+});
+
+/**
+ * setTimeout-based sleep that resolves immediately for non-positive delays,
+ * skipping the timer queue when there is nothing to wait for.
+ */
+function sleep(ms: number): Promise<void> {
+  if (ms <= 0) return Promise.resolve();
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+// Unreserved characters per RFC 3986 §2.3; path values made up entirely of
+// these (ids, timestamps, booleans — the common case) need no escaping.
+const UNRESERVED_RE = /^[A-Za-z0-9\-._~]*$/;
+
+/**
+ * TripIt passes request parameters as alternating /name/value path segments
+ * rather than a query string. Build them in one place so every value is
+ * percent-escaped; undefined entries are skipped and already-safe values
+ * bypass the encoder.
+ */
+function buildPath(
+  base: string,
+  params: Record<string, string | number | undefined>
+): string {
+  let path = base;
+  for (const [key, value] of Object.entries(params)) {
+    if (value !== undefined) {
+      const text = String(value);
+      path += `/${key}/${UNRESERVED_RE.test(text) ? text : encodeURIComponent(text)}`;
+    }
+  }
+  return path;
+}
+
+/**
+ * Build the final request URL. GET responses are requested as JSON via the
+ * trailing /format/json segment; POSTs carry format=json in the body instead.
+ */
+function buildRequestUrl(method: 'GET' | 'POST', path: string): URL {
+  return new URL(method === 'GET' ? `${BASE_URL}${path}/format/json` : `${BASE_URL}${path}`);
+}
+
+/** Form-encode a POST body, accepting either an object or pre-encoded JSON. */
+function encodeFormBody(
+  method: 'GET' | 'POST',
+  body?: Record<string, unknown> | string
+): string | undefined {
+  if (!body || method !== 'POST') return undefined;
+  const json = typeof body === 'string' ? body : JSON.stringify(body);
+  return `format=json&json=${encodeURIComponent(json)}`;
+}
+
+/** Map terminal response states to errors and decode the JSON body. */
+async function decodeResponse<T>(response: Response, path: string): Promise<T> {
+  if (response.status === 401) {
+    throw new AuthenticationError();
+  }
+  if (response.status === 404) {
+    throw new NotFoundError('resource', path);
+  }
+  if (!response.ok) {
+    throw new TripItError(response.status, await response.text());
+  }
+  try {
+    return (await response.json()) as T;
+  } catch {
+    throw new TripItError(response.status, 'Invalid JSON in response body');
+  }
+}
+
+/**
+ * One-shot signed request sharing the client's URL, body, and response
+ * helpers but none of its machinery: no rate limiter, no retries, no caches.
+ * There is no blocking HTTP on this runtime, so this is the lightweight path
+ * for scripts and tools making a handful of calls — a single attempt with
+ * errors surfaced directly. The MCP server keeps using TripItClient.
+ */
+export async function signedFetch<T = Record<string, unknown>>(
+  oauth: TripItOAuth,
+  accessToken: string,
+  accessTokenSecret: string,
+  method: 'GET' | 'POST',
+  path: string,
+  body?: Record<string, unknown> | string
+): Promise<T> {
+  const requestUrl = buildRequestUrl(method, path);
+  const encodedBody = encodeFormBody(method, body);
+  const headers = await oauth.signRequest(
+    method,
+    requestUrl.href,
+    accessToken,
+    accessTokenSecret,
+    encodedBody
+  );
+  Object.assign(headers, STATIC_HEADERS);
+
+  const options: RequestInit = { method, headers };
+  if (encodedBody) {
+    options.body = encodedBody;
+  }
+
+  const response = await fetch(requestUrl, options);
+  return decodeResponse<T>(response, path);
+}
+
+/**
+ * Counting semaphore bounding the number of concurrently in-flight requests.
+ */
+class Semaphore {
+  private waiters: Array<() => void> = [];
+  private available: number;
+
+  constructor(permits: number) {
+    this.available = permits;
+  }
+
+  async acquire(): Promise<void> {
+    if (this.available > 0) {
+      this.available -= 1;
+      return;
+    }
+    await new Promise<void>((resolve) => this.waiters.push(resolve));
+  }
+
+  release(): void {
+    const next = this.waiters.shift();
+    if (next) {
+      next();
+    } else {
+      this.available += 1;
+    }
+  }
+}
 
 export class TripItClient {
-  private lastRequestTime = 0;
+  /** Token-bucket burst allowance, fixed at construction. */
+  readonly bucketCapacity: number;
+  /** Sustained request rate in tokens per second (TripIt allows 2-5 req/s average). */
+  readonly refillRatePerSec: number;
+
+  private tokens: number;
+  private lastRefill = Date.now();
+  private inFlight: Semaphore;
+  private flightStatusCache = new TtlCache<{ AirObject?: AirObject }>(
+    TripItClient.FLIGHT_STATUS_TTL_MS
+  );
+  private readCache = new TtlCache<unknown>(TripItClient.READ_CACHE_TTL_MS);
 
   constructor(
     private oauth: TripItOAuth,
     private accessToken: string,
-    private accessTokenSecret: string
-  ) {}
+    private accessTokenSecret: string,
+    /** Pro accounts (and tests) can widen the bucket here; it cannot change afterwards. */
+    options?: { bucketCapacity?: number; refillRatePerSec?: number }
+  ) {
+    this.bucketCapacity = options?.bucketCapacity ?? 5;
+    this.refillRatePerSec = options?.refillRatePerSec ?? 3;
+    this.tokens = this.bucketCapacity;
+    this.inFlight = new Semaphore(this.bucketCapacity);
+  }
 
+  /**
+   * Token-bucket rate limiter. Idle clients get an immediate burst of up to
+   * bucketCapacity requests; sustained load averages refillRatePerSec. Tokens
+   * go negative under contention, so each concurrent caller synchronously
+   * claims its slot and sleeps out its own share of the debt — no lock needed
+   * on a single-threaded event loop.
+   */
   private async throttle(): Promise<void> {
     const now = Date.now();
-    const elapsed = now - this.lastRequestTime;
-    if (elapsed < MIN_REQUEST_INTERVAL_MS) {
-      await new Promise((resolve) => setTimeout(resolve, MIN_REQUEST_INTERVAL_MS - elapsed));
+    this.tokens = Math.min(
+      this.bucketCapacity,
+      this.tokens + ((now - this.lastRefill) / 1000) * this.refillRatePerSec
+    );
+    this.lastRefill = now;
+    this.tokens -= 1;
+    if (this.tokens < 0) {
+      await sleep((-this.tokens / this.refillRatePerSec) * 1000);
     }
-    this.lastRequestTime = Date.now();
   }
 
   private async request<T>(
     method: 'GET' | 'POST',
     path: string,
-    body?: Record<string, unknown>
+    body?: Record<string, unknown> | string
   ): Promise<T> {
-    let url = `${BASE_URL}${path}`;
+    // The URL and body are invariant across attempts, so build each once.
+    // Going through the native URL parser canonicalizes the string a single
+    // time, and the same canonical form is what gets signed and fetched.
+    const requestUrl = buildRequestUrl(method, path);
+    const encodedBody = encodeFormBody(method, body);
     let lastError: Error | null = null;
 
     for (let attempt = 0; attempt < MAX_RETRIES; attempt++) {
+      // Kick off signing before the rate limiter so the HMAC work overlaps
+      // any token-bucket wait; OAuth timestamps carry a ±3 hour tolerance, so
+      // signing slightly ahead of dispatch is safe. The stray-rejection
+      // handler keeps a signing failure during the wait from surfacing as an
+      // unhandled rejection — the awaited promise below still throws.
+      const headersPromise = this.oauth.signRequest(
+        method,
+        requestUrl.href,
+        this.accessToken,
+        this.accessTokenSecret,
+        encodedBody
+      );
+      headersPromise.catch(() => {});
+
       await this.throttle();
 
       try {
-        // For GET requests, append /format/json to path
-        const requestUrl = method === 'GET' ? `${url}/format/json` : url;
-
-        const headers = this.oauth.signRequest(
-          method,
-          requestUrl,
-          this.accessToken,
-          this.accessTokenSecret
-        );
-
-        const options: RequestInit = {
-          method,
-          headers: {
-            ...headers,
-            'Content-Type': 'application/x-www-form-urlencoded',
-          },
-        };
-
-        if (body && method === 'POST') {
-          options.body = `format=json&json=${encodeURIComponent(JSON.stringify(body))}`;
-        }
+        const headers = await headersPromise;
+
+        // signRequest returns a fresh object per call, so fill the static
+        // headers into it directly instead of spreading into another copy.
+        Object.assign(headers, STATIC_HEADERS);
 
-        const response = await fetch(requestUrl, options);
+        const options: RequestInit = { method, headers };
 
-        if (response.status === 401) {
-          throw new AuthenticationError();
+        if (encodedBody) {
+          options.body = encodedBody;
         }
 
-        if (response.status === 404) {
-          throw new NotFoundError('resource', path);
+        await this.inFlight.acquire();
+        let response: Response;
+        try {
+          response = await fetch(requestUrl, options);
+        } finally {
+          this.inFlight.release();
         }
 
         if (response.status === 429 || response.status >= 500) {
-          // Rate limited or server error - retry with backoff
-          const delay = BASE_DELAY_MS * Math.pow(2, attempt);
-          await new Promise((resolve) => setTimeout(resolve, delay));
+          // Rate limited or server error - retry with backoff, preferring the
+          // server's own Retry-After guidance when it sends one.
+          const retryAfter = Number(response.headers.get('Retry-After'));
+          const delay =
+            Number.isFinite(retryAfter) && retryAfter > 0
+              ? retryAfter * 1000
+              : BACKOFF_MS[attempt];
+          await sleep(delay);
           lastError = new TripItError(response.status, `Server error: ${response.status}`);
           continue;
         }
 
-        if (!response.ok) {
-          const text = await response.text();
-          throw new TripItError(response.status, text);
-        }
-
-        return (await response.json()) as T;
+        return await decodeResponse<T>(response, path);
       } catch (error) {
         if (error instanceof AuthenticationError || error instanceof NotFoundError) {
           throw error;
@@ -109,8 +310,7 @@ export class TripItClient {
           lastError = new TripItError(0, String(error));
         }
         // Retry on network errors
-        const delay = BASE_DELAY_MS * Math.pow(2, attempt);
-        await new Promise((resolve) => setTimeout(resolve, delay));
+        await sleep(BACKOFF_MS[attempt]);
       }
     }
 
@@ -128,31 +328,44 @@ export class TripItClient {
     page?: number;
     pageSize?: number;
   }): Promise<TripListResponse> {
-    let path = '/list/trip';
-    if (options?.past) path += '/past/true';
-    if (options?.modifiedSince) path += `/modified_since/${options.modifiedSince}`;
-    if (options?.includeObjects) path += '/include_objects/true';
-    if (options?.page) path += `/page_num/${options.page}`;
-    if (options?.pageSize) path += `/page_size/${options.pageSize}`;
+    const path = buildPath('/list/trip', {
+      past: options?.past ? 'true' : undefined,
+      modified_since: options?.modifiedSince,
+      include_objects: options?.includeObjects ? 'true' : undefined,
+      page_num: options?.page,
+      page_size: options?.pageSize,
+    });
 
     return this.request('GET', path);
   }
 
   async getTrip(id: string, includeObjects = true): Promise<TripResponse> {
-    const path = `/get/trip/id/${id}${includeObjects ? '/include_objects/true' : ''}`;
+    const path = buildPath('/get/trip', {
+      id,
+      include_objects: includeObjects ? 'true' : undefined,
+    });
     return this.request('GET', path);
   }
 
   async createTrip(data: CreateTripData): Promise<TripResponse> {
-    return this.request('POST', '/create', { Trip: data });
+    const result = await this.request<TripResponse>('POST', '/create', { Trip: data });
+    this.invalidateCache();
+    return result;
   }
 
   async updateTrip(id: string, data: Partial<CreateTripData>): Promise<TripResponse> {
-    return this.request('POST', `/replace/trip/id/${id}`, { Trip: data });
+    const result = await this.request<TripResponse>(
+      'POST',
+      buildPath('/replace/trip', { id }),
+      { Trip: data }
+    );
+    this.invalidateCache();
+    return result;
   }
 
   async deleteTrip(id: string): Promise<void> {
-    await this.request('GET', `/delete/trip/id/${id}`);
+    await this.request('GET', buildPath('/delete/trip', { id }));
+    this.invalidateCache();
   }
 
   // ========================================================================
@@ -160,12 +373,31 @@ export class TripItClient {
   // ========================================================================
 
   async getObject<T = Record<string, unknown>>(type: ObjectType, id: string): Promise<T> {
-    return this.request('GET', `/get/${type}/id/${id}`);
+    return this.request('GET', buildPath(`/get/${type}`, { id }));
   }
 
   async listObjects(type: ObjectType, tripId?: string): Promise<Record<string, unknown>> {
-    const path = tripId ? `/list/${type}/trip_id/${tripId}` : `/list/${type}`;
-    return this.request('GET', path);
+    return this.request('GET', buildPath(`/list/${type}`, { trip_id: tripId }));
+  }
+
+  /**
+   * Fetch several objects of one type concurrently. The token bucket paces
+   * the overall rate and the in-flight semaphore caps concurrency, so the
+   * fan-out overlaps round trips instead of awaiting each object in turn.
+   * Failures come back in-place as TripItError rather than rejecting the lot.
+   */
+  async getObjects<T = Record<string, unknown>>(
+    type: ObjectType,
+    ids: string[]
+  ): Promise<Array<T | TripItError>> {
+    const results = await Promise.allSettled(ids.map((id) => this.getObject<T>(type, id)));
+    return results.map((result) =>
+      result.status === 'fulfilled'
+        ? result.value
+        : result.reason instanceof TripItError
+          ? result.reason
+          : new TripItError(0, String(result.reason))
+    );
   }
 
   async createObject(
@@ -174,11 +406,19 @@ export class TripItClient {
     tripId?: string
   ): Promise<Record<string, unknown>> {
     const key = this.capitalize(type);
-    const payload: Record<string, unknown> = { [key]: data };
-    if (tripId) {
-      (payload[key] as Record<string, unknown>).trip_id = tripId;
-    }
-    return this.request('POST', '/create', payload);
+    // The wire payload always wraps the object under a single type key, so
+    // splice that wrapper around the encoded data directly instead of
+    // allocating an intermediate object just to re-serialize it. The key is
+    // stringified too: capitalize() echoes unknown types verbatim, and a raw
+    // splice would let quotes or backslashes corrupt the body JSON.
+    const withTrip = tripId ? { ...data, trip_id: tripId } : data;
+    const result = await this.request<Record<string, unknown>>(
+      'POST',
+      '/create',
+      `{${JSON.stringify(key)}:${JSON.stringify(withTrip)}}`
+    );
+    this.invalidateCache();
+    return result;
   }
 
   async updateObject(
@@ -187,11 +427,18 @@ export class TripItClient {
     data: Record<string, unknown>
   ): Promise<Record<string, unknown>> {
     const key = this.capitalize(type);
-    return this.request('POST', `/replace/${type}/id/${id}`, { [key]: data });
+    const result = await this.request<Record<string, unknown>>(
+      'POST',
+      buildPath(`/replace/${type}`, { id }),
+      `{${JSON.stringify(key)}:${JSON.stringify(data)}}`
+    );
+    this.invalidateCache();
+    return result;
   }
 
   async deleteObject(type: ObjectType, id: string): Promise<void> {
-    await this.request('GET', `/delete/${type}/id/${id}`);
+    await this.request('GET', buildPath(`/delete/${type}`, { id }));
+    this.invalidateCache();
   }
 
   // ========================================================================
@@ -335,16 +582,58 @@ export class TripItClient {
   // Pro Features
   // ========================================================================
 
+  /** Cache lifetime for flight status lookups; polling UIs refresh far faster than statuses change. */
+  static readonly FLIGHT_STATUS_TTL_MS = 30_000;
+
+  /** Cache lifetime for slow-changing reads (profile, points programs). */
+  static readonly READ_CACHE_TTL_MS = 60_000;
+
   async getFlightStatus(airId: string): Promise<{ AirObject?: AirObject }> {
-    return this.request('GET', `/get/air/id/${airId}`);
+    const cached = this.flightStatusCache.get(airId);
+    if (cached) {
+      return cached;
+    }
+
+    const result = await this.request<{ AirObject?: AirObject }>(
+      'GET',
+      buildPath('/get/air', { id: airId })
+    );
+    this.flightStatusCache.set(airId, result);
+    return result;
   }
 
-  async listPointsPrograms(): Promise<PointsProgramResponse> {
-    return this.request('GET', '/list/points_program');
+  async listPointsPrograms(
+    ttlMs = TripItClient.READ_CACHE_TTL_MS
+  ): Promise<PointsProgramResponse> {
+    return this.cachedGet<PointsProgramResponse>('/list/points_program', ttlMs);
   }
 
-  async getProfile(): Promise<ProfileResponse> {
-    return this.request('GET', '/get/profile');
+  async getProfile(ttlMs = TripItClient.READ_CACHE_TTL_MS): Promise<ProfileResponse> {
+    return this.cachedGet<ProfileResponse>('/get/profile', ttlMs);
+  }
+
+  /**
+   * GET with a TTL cache keyed by endpoint path. Pass ttlMs of 0 to force a
+   * fresh fetch. Trip and object listings stay uncached — they are
+   * user-mutable and callers expect writes to show up immediately.
+   */
+  private async cachedGet<T>(path: string, ttlMs: number): Promise<T> {
+    // A non-positive ttlMs means the caller wants a fresh response, so skip
+    // the cache read entirely rather than serving a still-valid entry.
+    const cached = ttlMs > 0 ? this.readCache.get(path) : undefined;
+    if (cached !== undefined) {
+      return cached as T;
+    }
+
+    const result = await this.request<T>('GET', path);
+    this.readCache.set(path, result, ttlMs);
+    return result;
+  }
+
+  /** Drop all cached responses; called after any write so reads stay coherent. */
+  invalidateCache(): void {
+    this.readCache.clear();
+    this.flightStatusCache.clear();
   }
 
   // ========================================================================
@@ -352,21 +641,6 @@ export class TripItClient {
   // ========================================================================
 
   private capitalize(s: string): string {
-    // Map object type to TripIt's expected key format
-    const typeMap: Record<string, string> = {
-      air: 'AirObject',
-      lodging: 'LodgingObject',
-      car: 'CarObject',
-      rail: 'RailObject',
-      cruise: 'CruiseObject',
-      restaurant: 'RestaurantObject',
-      activity: 'ActivityObject',
-      note: 'NoteObject',
-      directions: 'DirectionsObject',
-      transport: 'TransportObject',
-      parking: 'ParkingObject',
-      map: 'MapObject',
-    };
-    return typeMap[s] || s.charAt(0).toUpperCase() + s.slice(1);
+    return TYPE_TO_KEY[s] || s.charAt(0).toUpperCase() + s.slice(1);
   }
 }
@@ -11,8 +11,43 @@ const REQUEST_TOKEN_URL = 'https://api.tripit.com/oauth/request_token';
 const AUTHORIZE_URL = 'https://www.tripit.com/oauth/authorize';
 const ACCESS_TOKEN_URL = 'https://api.tripit.com/oauth/access_token';
 
+// Unreserved characters per RFC 3986 §2.3. Strings made up entirely of these
+// survive percent-encoding unchanged, which covers the common case on the
+// sign path: oauth keys, nonces, timestamps, and numeric ids.
+const UNRESERVED_RE = /^[A-Za-z0-9\-._~]*$/;
+
+/**
+ * RFC 3986 percent-encoding as required by OAuth 1.0a signature base strings.
+ * encodeURIComponent leaves !'()* unescaped, so fix those up; values that are
+ * entirely unreserved skip the encoder and its replace pass altogether.
+ */
+export function percentEncode(value: string): string {
+  if (UNRESERVED_RE.test(value)) return value;
+  return encodeURIComponent(value).replace(
+    /[!'()*]/g,
+    (c) => '%' + c.charCodeAt(0).toString(16).toUpperCase()
+  );
+}
+
+/**
+ * 128-bit random nonce, base64url-encoded to 22 characters — well under
+ * TripIt's 80-character nonce cap. One getRandomValues call, no UUID
+ * formatting or regex stripping on the sign path.
+ */
+function generateNonce(): string {
+  const bytes = crypto.getRandomValues(new Uint8Array(16));
+  return btoa(String.fromCharCode(...bytes))
+    .replace(/\+/g, '-')
+    .replace(/\//g, '_')
+    .replace(/=+$/, '');
+}
+
 export class TripItOAuth {
   private oauth: OAuth;
+  // Imported HMAC keys, cached per signing-key string. Key material is fixed
+  // per token pair, so the importKey setup runs once and every subsequent
+  // signature is a single crypto.subtle.sign over the base string.
+  private hmacKeys = new Map<string, Promise<CryptoKey>>();
 
   constructor(
     private consumerKey: string,
@@ -28,20 +63,28 @@ export class TripItOAuth {
     });
   }
 
+  private importHmacKey(key: string): Promise<CryptoKey> {
+    let cryptoKey = this.hmacKeys.get(key);
+    if (!cryptoKey) {
+      cryptoKey = crypto.subtle.importKey(
+        'raw',
+        new TextEncoder().encode(key),
+        { name: 'HMAC', hash: 'SHA-1' },
+        false,
+        ['sign']
+      );
+      this.hmacKeys.set(key, cryptoKey);
+    }
+    return cryptoKey;
+  }
+
   private async hmacSha1(message: string, key: string): Promise<string> {
-    const encoder = new TextEncoder();
-    const keyData = encoder.encode(key);
-    const messageData = encoder.encode(message);
-
-    const cryptoKey = await crypto.subtle.importKey(
-      'raw',
-      keyData,
-      { name: 'HMAC', hash: 'SHA-1' },
-      false,
-      ['sign']
+    const cryptoKey = await this.importHmacKey(key);
+    const signature = await crypto.subtle.sign(
+      'HMAC',
+      cryptoKey,
+      new TextEncoder().encode(message)
     );
-
-    const signature = await crypto.subtle.sign('HMAC', cryptoKey, messageData);
     return btoa(String.fromCharCode(...new Uint8Array(signature)));
   }
 
@@ -131,17 +174,66 @@ export class TripItOAuth {
     return { token, tokenSecret };
   }
 
-  signRequest(
+  /**
+   * Direct OAuth 1.0a HMAC-SHA1 signer.
+   *
+   * The consumer and token credentials never change for a given client, so
+   * there is no need to go through oauth-1.0a's generic parameter handling on
+   * every API call. Builds the signature base string per RFC 5849 §3.4.1:
+   * sorted, percent-encoded oauth_* params plus any query-string and
+   * form-encoded body params.
+   */
+  async signRequest(
     method: string,
     url: string,
     accessToken: string,
-    accessTokenSecret: string
-  ): Record<string, string> {
-    return this.oauth.toHeader(
-      this.oauth.authorize(
-        { url, method },
-        { key: accessToken, secret: accessTokenSecret }
-      )
-    ) as Record<string, string>;
+    accessTokenSecret: string,
+    body?: string,
+    /** Fixed nonce/timestamp for known-answer tests; production callers omit this. */
+    overrides?: { nonce?: string; timestamp?: string }
+  ): Promise<Record<string, string>> {
+    const oauthParams: Record<string, string> = {
+      oauth_consumer_key: this.consumerKey,
+      oauth_nonce: overrides?.nonce ?? generateNonce(),
+      oauth_signature_method: 'HMAC-SHA1',
+      oauth_timestamp: overrides?.timestamp ?? String(Math.floor(Date.now() / 1000)),
+      oauth_token: accessToken,
+      oauth_version: '1.0',
+    };
+
+    // Collect oauth_* params plus query-string and form body params, then
+    // sort by encoded key/value as the base string requires.
+    const queryIndex = url.indexOf('?');
+    const baseUrl = queryIndex === -1 ? url : url.slice(0, queryIndex);
+    const pairs: Array<[string, string]> = Object.entries(oauthParams);
+    if (queryIndex !== -1) {
+      for (const [key, value] of new URLSearchParams(url.slice(queryIndex + 1))) {
+        pairs.push([key, value]);
+      }
+    }
+    if (body) {
+      for (const [key, value] of new URLSearchParams(body)) {
+        pairs.push([key, value]);
+      }
+    }
+
+    // RFC 5849 §3.4.1.3.2 requires ascending byte-value ordering, so compare
+    // code units directly — locale-aware collation would reorder mixed-case
+    // values (e.g. put "a" before "B") and corrupt the signature.
+    const byCodeUnit = (a: string, b: string) => (a < b ? -1 : a > b ? 1 : 0);
+    const encodedPairs = pairs
+      .map(([key, value]): [string, string] => [percentEncode(key), percentEncode(value)])
+      .sort(([ak, av], [bk, bv]) => byCodeUnit(ak, bk) || byCodeUnit(av, bv));
+    const paramString = encodedPairs.map(([key, value]) => `${key}=${value}`).join('&');
+
+    const baseString = `${method.toUpperCase()}&${percentEncode(baseUrl)}&${percentEncode(paramString)}`;
+    const signingKey = `${percentEncode(this.consumerSecret)}&${percentEncode(accessTokenSecret)}`;
+    oauthParams.oauth_signature = await this.hmacSha1(baseString, signingKey);
+
+    const header = Object.entries(oauthParams)
+      .map(([key, value]) => `${percentEncode(key)}="${percentEncode(value)}"`)
+      .join(', ');
+
+    return { Authorization: `OAuth ${header}` };
   }
 }
@@ -0,0 +1,69 @@
+/**
+ * Tests for the TTL + LRU cache.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { TtlCache } from '../src/lib/cache.js';
+
+describe('TtlCache', () => {
+  it('returns entries until their TTL elapses', () => {
+    const cache = new TtlCache<string>(1000);
+    cache.set('k', 'v', 1000, 0);
+
+    expect(cache.get('k', 999)).toBe('v');
+    expect(cache.get('k', 1000)).toBeUndefined();
+    // Expired entries are dropped, not resurrected.
+    expect(cache.get('k', 0)).toBeUndefined();
+  });
+
+  it('uses the default TTL when set is not given one', () => {
+    const cache = new TtlCache<string>(500);
+    cache.set('k', 'v', undefined, 0);
+
+    expect(cache.get('k', 499)).toBe('v');
+    expect(cache.get('k', 500)).toBeUndefined();
+  });
+
+  it('evicts the least recently used entry at capacity', () => {
+    const cache = new TtlCache<string>(1000, 2);
+    cache.set('a', '1', 1000, 0);
+    cache.set('b', '2', 1000, 0);
+    cache.set('c', '3', 1000, 0);
+
+    expect(cache.get('a', 1)).toBeUndefined();
+    expect(cache.get('b', 1)).toBe('2');
+    expect(cache.get('c', 1)).toBe('3');
+  });
+
+  it('refreshes recency on hit so hot entries survive eviction', () => {
+    const cache = new TtlCache<string>(1000, 2);
+    cache.set('a', '1', 1000, 0);
+    cache.set('b', '2', 1000, 0);
+
+    // Touch "a" so "b" becomes the eviction candidate.
+    expect(cache.get('a', 1)).toBe('1');
+    cache.set('c', '3', 1000, 1);
+
+    expect(cache.get('a', 2)).toBe('1');
+    expect(cache.get('b', 2)).toBeUndefined();
+    expect(cache.get('c', 2)).toBe('3');
+  });
+
+  it('overwrites an existing key without evicting others', () => {
+    const cache = new TtlCache<string>(1000, 2);
+    cache.set('a', '1', 1000, 0);
+    cache.set('b', '2', 1000, 0);
+    cache.set('a', 'updated', 1000, 0);
+
+    expect(cache.get('a', 1)).toBe('updated');
+    expect(cache.get('b', 1)).toBe('2');
+  });
+
+  it('clear drops everything', () => {
+    const cache = new TtlCache<string>(1000);
+    cache.set('a', '1', 1000, 0);
+    cache.clear();
+
+    expect(cache.get('a', 1)).toBeUndefined();
+  });
+});
@@ -0,0 +1,119 @@
+/**
+ * Tests for TripItClient request pacing and response caching, with TripIt
+ * traffic stubbed out.
+ */
+
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { TripItOAuth } from '../src/tripit/oauth.js';
+import { TripItClient } from '../src/tripit/client.js';
+
+function jsonResponse(body: unknown = {}): Response {
+  return new Response(JSON.stringify(body), {
+    status: 200,
+    headers: { 'Content-Type': 'application/json' },
+  });
+}
+
+function createClient(options?: {
+  bucketCapacity?: number;
+  refillRatePerSec?: number;
+}): TripItClient {
+  const oauth = new TripItOAuth('test-consumer-key', 'test-consumer-secret');
+  return new TripItClient(oauth, 'test-token', 'test-token-secret', options);
+}
+
+afterEach(() => {
+  vi.unstubAllGlobals();
+});
+
+describe('TripItClient rate limiting', () => {
+  it('defaults the bucket to 5 tokens refilled at 3/s', () => {
+    const client = createClient();
+    expect(client.bucketCapacity).toBe(5);
+    expect(client.refillRatePerSec).toBe(3);
+  });
+
+  it('wires constructor options through to the bucket', () => {
+    const client = createClient({ bucketCapacity: 10, refillRatePerSec: 5 });
+    expect(client.bucketCapacity).toBe(10);
+    expect(client.refillRatePerSec).toBe(5);
+  });
+
+  it('serves an initial burst immediately and paces the excess', async () => {
+    const fetchMock = vi.fn(async () => jsonResponse({}));
+    vi.stubGlobal('fetch', fetchMock);
+    const client = createClient({ bucketCapacity: 2, refillRatePerSec: 10 });
+
+    const start = Date.now();
+    await Promise.all([client.getTrip('1'), client.getTrip('2')]);
+    const burstElapsed = Date.now() - start;
+
+    // The third call finds the bucket empty and must sleep out its token
+    // debt: one token at 10/s is ~100ms.
+    await client.getTrip('3');
+    const totalElapsed = Date.now() - start;
+
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+    expect(burstElapsed).toBeLessThan(80);
+    expect(totalElapsed).toBeGreaterThanOrEqual(90);
+  });
+
+  it('caps concurrently in-flight requests at the bucket capacity', async () => {
+    let inFlight = 0;
+    let maxInFlight = 0;
+    const fetchMock = vi.fn(async () => {
+      inFlight += 1;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await new Promise((resolve) => setTimeout(resolve, 20));
+      inFlight -= 1;
+      return jsonResponse({});
+    });
+    vi.stubGlobal('fetch', fetchMock);
+    const client = createClient({ bucketCapacity: 2, refillRatePerSec: 1000 });
+
+    await client.getObjects('air', ['1', '2', '3', '4', '5', '6']);
+
+    expect(fetchMock).toHaveBeenCalledTimes(6);
+    expect(maxInFlight).toBeLessThanOrEqual(2);
+  });
+});
+
+describe('TripItClient read caching', () => {
+  it('serves repeated profile reads from cache within the TTL', async () => {
+    const fetchMock = vi.fn(async () => jsonResponse({ Profile: {} }));
+    vi.stubGlobal('fetch', fetchMock);
+    const client = createClient();
+
+    await client.getProfile();
+    await client.getProfile();
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('refetches when the caller passes a ttlMs of 0', async () => {
+    const fetchMock = vi.fn(async () => jsonResponse({ Profile: {} }));
+    vi.stubGlobal('fetch', fetchMock);
+    const client = createClient();
+
+    await client.getProfile();
+    await client.getProfile(0);
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('invalidates cached reads after a write', async () => {
+    const fetchMock = vi.fn(async () => jsonResponse({}));
+    vi.stubGlobal('fetch', fetchMock);
+    const client = createClient();
+
+    await client.getProfile();
+    await client.createTrip({
+      display_name: 'Test Trip',
+      start_date: '2026-09-01',
+      end_date: '2026-09-05',
+    });
+    await client.getProfile();
+
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+  });
+});
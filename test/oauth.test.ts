@@ -0,0 +1,98 @@
+/**
+ * Tests for the direct OAuth 1.0a signer.
+ *
+ * Known-answer signatures were computed with an independent HMAC-SHA1
+ * implementation over RFC 5849 base strings using the fixed nonce/timestamp
+ * below.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { TripItOAuth, percentEncode } from '../src/tripit/oauth.js';
+
+const CONSUMER_KEY = 'test-consumer-key';
+const CONSUMER_SECRET = 'test-consumer-secret';
+const ACCESS_TOKEN = 'test-token';
+const ACCESS_TOKEN_SECRET = 'test-token-secret';
+
+const OVERRIDES = { nonce: 'abc123', timestamp: '1735689600' };
+
+function signatureOf(headers: Record<string, string>): string {
+  const match = headers.Authorization.match(/oauth_signature="([^"]+)"/);
+  return match ? decodeURIComponent(match[1]) : '';
+}
+
+describe('percentEncode', () => {
+  it('leaves unreserved characters untouched', () => {
+    expect(percentEncode('Abc-123_.~')).toBe('Abc-123_.~');
+  });
+
+  it("escapes !'()* beyond what encodeURIComponent does", () => {
+    expect(percentEncode("!'()*")).toBe('%21%27%28%29%2A');
+  });
+
+  it('escapes reserved and non-ASCII characters', () => {
+    expect(percentEncode('a b&c=d')).toBe('a%20b%26c%3Dd');
+    expect(percentEncode('é')).toBe('%C3%A9');
+  });
+});
+
+describe('signRequest', () => {
+  const oauth = new TripItOAuth(CONSUMER_KEY, CONSUMER_SECRET);
+
+  it('produces the known-answer signature for a GET with no query', async () => {
+    const headers = await oauth.signRequest(
+      'GET',
+      'https://api.tripit.com/v1/list/trip/format/json',
+      ACCESS_TOKEN,
+      ACCESS_TOKEN_SECRET,
+      undefined,
+      OVERRIDES
+    );
+
+    expect(headers.Authorization).toMatch(/^OAuth oauth_consumer_key="test-consumer-key"/);
+    expect(headers.Authorization).toContain('oauth_nonce="abc123"');
+    expect(headers.Authorization).toContain('oauth_timestamp="1735689600"');
+    expect(signatureOf(headers)).toBe('2tRGWwknUfXT1jzTYquXdTyMkqc=');
+  });
+
+  it('signs form-encoded POST body parameters', async () => {
+    const json = JSON.stringify({ Trip: { display_name: 'Test' } });
+    const body = `format=json&json=${encodeURIComponent(json)}`;
+
+    const headers = await oauth.signRequest(
+      'POST',
+      'https://api.tripit.com/v1/create',
+      ACCESS_TOKEN,
+      ACCESS_TOKEN_SECRET,
+      body,
+      OVERRIDES
+    );
+
+    expect(signatureOf(headers)).toBe('JG+6cBCy1UcGM6ODm3aGeM0OQ+8=');
+  });
+
+  it('orders mixed-case parameters by byte value, not locale collation', async () => {
+    // RFC 5849 ordering puts "Z" before "a"; ICU collation would not.
+    const headers = await oauth.signRequest(
+      'GET',
+      'https://api.tripit.com/v1/list/trip/format/json?Z=1&a=2',
+      ACCESS_TOKEN,
+      ACCESS_TOKEN_SECRET,
+      undefined,
+      OVERRIDES
+    );
+
+    expect(signatureOf(headers)).toBe('Qwe7Pgw6sz/IekrXsHlefCdqrLs=');
+  });
+
+  it('generates a fresh nonce per call when no overrides are given', async () => {
+    const url = 'https://api.tripit.com/v1/get/profile/format/json';
+    const first = await oauth.signRequest('GET', url, ACCESS_TOKEN, ACCESS_TOKEN_SECRET);
+    const second = await oauth.signRequest('GET', url, ACCESS_TOKEN, ACCESS_TOKEN_SECRET);
+
+    const nonceOf = (h: Record<string, string>) =>
+      h.Authorization.match(/oauth_nonce="([^"]+)"/)?.[1];
+    expect(nonceOf(first)).toBeTruthy();
+    expect(nonceOf(first)).not.toBe(nonceOf(second));
+  });
+});